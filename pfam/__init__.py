@@ -1,10 +1,47 @@
+import itertools
+import operator
 import re
 import requests
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import xml.etree.ElementTree as ElementTree
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+# Pattern of the default namespace declared in the root of Pfam XML
+_XMLNS_PATTERN = re.compile(b' xmlns="[^"]+"')
 
-def request (path: str, params: dict = {}, headers: dict = None, timeout: float = None) -> ElementTree:
+# Bytes of the XML head where the namespace is searched and
+# size of the chunks in which the responses are downloaded
+_HEAD_SIZE  = 4096
+_CHUNK_SIZE = 64 * 1024
+
+# Session shared by all the requests, it keeps the connections
+# to the server alive and reuses them from a pool
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.2))
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+
+def enable_cache(name: str = 'pfam_cache', expire_after: timedelta = timedelta(days=7)):
+
+    # The cache is an optional feature provided by requests-cache
+    import requests_cache
+
+    global _session
+
+    # Replace the session with one that stores the responses in a
+    # SQLite database, expired responses are revalidated using their
+    # ETag and Last-Modified headers
+    _session = requests_cache.CachedSession(name, backend='sqlite', expire_after=expire_after)
+    _session.mount('http://', _adapter)
+    _session.mount('https://', _adapter)
+
+
+def request (path: str, params: dict = {}, headers: dict = None, timeout: float = None, builders: dict = None) -> ElementTree:
 
     # Default value for option 'output'
     params.setdefault('output', 'xml')
@@ -12,44 +49,70 @@ def request (path: str, params: dict = {}, headers: dict = None, timeout: float
     # Compose the url
     url = 'http://pfam.xfam.org' + path 
 
-    # Make the request to pfam
-    response = requests.get(url, params=params, headers=headers, timeout=timeout)
+    # Make the request to pfam, the body is downloaded while it is processed
+    with _session.get(url, params=params, headers=headers, timeout=timeout, stream=True) as response:
 
-    # Throw an execption if HTTP status is not ok
-    response.raise_for_status ()
+        # Throw an execption if HTTP status is not ok
+        response.raise_for_status ()
 
-    # If the output is an XML file, parse it
-    if params['output'] == 'xml':
+        # If the output is an XML file, parse it
+        if params['output'] == 'xml':
 
-        # Remove the namespace from the xml
-        xml = re.sub(' xmlns="[^"]+"', '', response.text, count=1)
+            # Work on the raw bytes, so that the body is never decoded into a str
+            chunks = response.iter_content(_CHUNK_SIZE)
 
-        # Parse the XML and create the root element
-        root = ElementTree.fromstring(xml)
+            # The namespace is declared in the root element at the beginning of
+            # the document, the head is collected to search for it
+            head = b''
 
-        # Check if is an error
-        if root.tag == 'error':
-            raise Exception(root.text)
+            for chunk in chunks:
+                head += chunk
 
-        # Process all values in the XML tree
-        xml_process_tree(root)
+                if len(head) >= _HEAD_SIZE:
+                    break
 
-        # Return the XML root
-        return root
+            match = _XMLNS_PATTERN.search(head, 0, _HEAD_SIZE)
+            start, end = match.span() if match else (0, 0)
 
-    # Return the response as text
-    else:
-        return response.text
+            # Parse the XML incrementally with the C accelerated parser,
+            # it reads the encoding from the XML declaration
+            parser = ElementTree.XMLPullParser(events=('end',))
 
+            # Feed the parser around the namespace and then with the rest of
+            # the body as soon as it is received
+            for data in itertools.chain((head[:start], memoryview(head)[end:]), chunks):
+                parser.feed(data)
 
-def xml_process_value(value: str):
+                for event, el in parser.read_events():
 
-    # The value can be None
-    if value is None:
-        return None
+                    # Elements with a builder are consumed as soon as they are
+                    # complete and then cleared to free their subtree
+                    if builders is not None and el.tag in builders:
+                        builders[el.tag](el)
+                        el.clear()
+
+            # Check that the document is complete
+            parser.close()
+
+            # The root element is the last one to be completed
+            root = el
 
-    # This function process only strings 
-    if type(value) != str:
+            # Check if is an error
+            if root.tag == 'error':
+                raise Exception(xml_process_value(root.text))
+
+            # Return the XML root
+            return root
+
+        # Return the response as text
+        else:
+            return response.text
+
+
+def xml_process_value(value: str):
+
+    # This function process only strings, None is returned as is
+    if not isinstance(value, str):
         return value
 
     # Otherwise it is a string
@@ -59,31 +122,75 @@ def xml_process_value(value: str):
     if value == '':
         return None
 
-    # Try to convert into a float
-    try:
-        return float(value)
+    # Try to convert into a float only if it can be a number, most
+    # values are text and the exception raised by float() is slow
+    first = value[0]
+
+    if first.isdigit() or first in '-+.':
+        try:
+            return float(value)
 
-    except ValueError:
-        pass
+        except ValueError:
+            pass
 
     # Return the string stripped
     return value
 
 
-def xml_process_tree(element: ElementTree):
-
-    # Visit all element in the XML tree
-    for el in element.iter():
-
-        # Process the text contained in the element
-        el.text = xml_process_value(el.text)
-
-        # Process all the attributes
-        for name in el.attrib:
-            el.attrib[name] = xml_process_value(el.attrib[name])
+# Types of the fields whose values are known, the others are guessed
+_FIELD_TYPES = { 'num_archs':           int,
+                 'num_seqs_seed':       int,
+                 'num_seqs_full':       int,
+                 'num_species':         int,
+                 'num_structures':      int,
+                 'num_occurrences':     int,
+                 'model_length':        int,
+                 'model_version':       int,
+                 'tax_id':              int,
+                 'sequence_version':    int,
+                 'percentage_identity': float,
+                 'percentage_hits':     float,
+                 'av_length':           float,
+                 'av_coverage':         float,
+                 'cutoff':              float,
+                 'db_release':          str,
+                 'description':         str,
+                 'comment':             str,
+                 'sequence':            str,
+                 'taxonomy':            str,
+                 'build_commands':      str,
+                 'search_commands':     str,
+                 'hmm':                 str,
+                 'match_string':        str,
+                 'pp':                  str,
+                 'seq':                 str,
+                 'raw':                 str }
+
+
+def xml_process_field(name: str, value: str):
+
+    # Look up the type of the field
+    cast = _FIELD_TYPES.get(name)
+
+    # Convert directly the values of known type
+    if cast is not None and value:
+        value = value.strip()
+        return cast(value) if value else None
+
+    # Otherwise guess the type from the value
+    return xml_process_value(value)
+
+
+def xml_process_label(value: str):
+
+    # Labels repeat in many elements (types, categories, evidences),
+    # interned they share a single string object
+    return sys.intern(value) if value is not None else None
 
 class PfamEntry:
 
+    __slots__ = ('id', 'accession', 'description', 'type')
+
     def __init__(self, type: str, id: str, accession: str, description: str):
 
         # Set the members as the parameters
@@ -104,12 +211,14 @@ class PfamEntry:
             return protein(self.id)
 
 class PfamClanMember:
-    
+
+    __slots__ = ('entry', 'num_occurrences', 'percentage_hits')
+
     def __init__(self, element: ElementTree):
 
         self.entry           : PfamEntry = PfamEntry('Pfam-A', element.get('id'), element.get('accession'), None)
-        self.num_occurrences : float     = element.get('num_occurrences')
-        self.percentage_hits : float     = element.get('percentage_hits')
+        self.num_occurrences : int       = xml_process_field('num_occurrences', element.get('num_occurrences'))
+        self.percentage_hits : float     = xml_process_field('percentage_hits', element.get('percentage_hits'))
 
 class PfamClan:
 
@@ -128,23 +237,32 @@ class PfamClan:
         
         # Process child nodes
         for el in entry:
-            
-            # Trasform the element curation_details in a object
-            if el.tag == 'members':
-                for member in el:
-                    self.families.append (PfamClanMember(member))
+
+            # Look up the parser of the element
+            parser = PfamClan._parsers.get(el.tag)
+
+            if parser is not None:
+                parser(self, el)
             
             # Set an attribute of this object using the text content of the element as value
             else:
-                setattr(self, el.tag, el.text)
+                setattr(self, el.tag, xml_process_field(el.tag, el.text))
 
         # Entry of this clan
         self.entry: PfamEntry = PfamEntry(entry.get('entry_type'), entry.get('id'), entry.get('accession'), self.description)
 
+    def _parse_members(self, el: ElementTree):
+        for member in el:
+            self.families.append (PfamClanMember(member))
+
+    # Parsers of the child nodes that are not plain text
+    _parsers = { 'members': _parse_members }
 
 
 class PfarmGOTerm:
 
+    __slots__ = ('id', 'category', 'text')
+
     def __init__(self, id: str, category: str, text: str):
 
         # Save the parameters as members
@@ -173,12 +291,12 @@ class PfamCurationDetails:
         
             # A special parsing for <num_seqs> tag
             if el.tag == 'num_seqs':
-                self.num_seqs_seed: float = el.find('seed').text
-                self.num_seqs_full: float = el.find('full').text
+                self.num_seqs_seed: int = xml_process_field('num_seqs_seed', el.find('seed').text)
+                self.num_seqs_full: int = xml_process_field('num_seqs_full', el.find('full').text)
 
             # Set an attribute of this object using the text content of the element as value
             else:
-                setattr(self, el.tag, el.text)
+                setattr(self, el.tag, xml_process_field(el.tag, el.text))
 
 
 class PfamCutoff:
@@ -196,8 +314,8 @@ class PfamHmmDetails:
 
         # Attributes of the <hmm_details> tag
         self.hmmer_version : str = element.get('hmmer_version')
-        self.model_version : str = element.get('model_version')
-        self.model_length  : int = element.get('model_length')
+        self.model_version : int = xml_process_field('model_version', element.get('model_version'))
+        self.model_length  : int = xml_process_field('model_length', element.get('model_length'))
 
         # Other propperties fetched form the child nodes
         self.build_commands  : str  = None
@@ -210,11 +328,11 @@ class PfamHmmDetails:
             # A special parsing for <cutoffs> tag
             if el.tag == 'cutoffs':
                 for cutoff in el:
-                    self.cutoffs[cutoff.tag] = PfamCutoff(cutoff.find('sequence').text, cutoff.find('domain').text)
+                    self.cutoffs[cutoff.tag] = PfamCutoff(xml_process_field('cutoff', cutoff.find('sequence').text), xml_process_field('cutoff', cutoff.find('domain').text))
 
             # Set an attribute of this object using the text content of the element as value
             else:
-                setattr(self, el.tag, el.text)
+                setattr(self, el.tag, xml_process_field(el.tag, el.text))
         
 
 class PfamFamily:
@@ -228,42 +346,75 @@ class PfamFamily:
         # Text of the family
         self.description : str = None
         self.comment     : str = None
+
+        # Elements parsed only when the details are accessed
+        self._curation_details_el : ElementTree = None
+        self._hmm_details_el      : ElementTree = None
         
         # Process child nodes
         for el in entry:
-            
-            # Trasform the element curation_details in a object
-            if el.tag == 'curation_details':
-                self.curation_details: PfamCurationDetails = PfamCurationDetails(el)
-
-            # Trasform the element hmm_details in a object
-            elif el.tag == 'hmm_details':
-                self.hmm_details: PfamHmmDetails = PfamHmmDetails(el)
-            
-            elif el.tag == 'clan_membership':
-                self.clan_entry : PfamEntry = PfamEntry('Clan', el.get('clan_id'), el.get('clan_acc'), None)
-
-            # Parse GO terms in a list of dicts
-            elif el.tag == 'go_terms':
-                self.go_terms: [PfarmGOTerm] = []
-
-                # Iterate over categories
-                for cat in el:
 
-                    # The category name
-                    category = cat.get('name')
+            # Look up the parser of the element
+            parser = PfamFamily._parsers.get(el.tag)
 
-                    # Insert in the list all the terms
-                    for term in cat:
-                        self.go_terms.append(PfarmGOTerm(term.get('go_id'), category, term.text))
+            if parser is not None:
+                parser(self, el)
             
             # Set an attribute of this object using the text content of the element as value
             else:
-                setattr(self, el.tag, el.text)
+                setattr(self, el.tag, xml_process_field(el.tag, el.text))
 
         # Entry of this family (for consistency)
         self.entry: PfamEntry = PfamEntry(entry.get('entry_type'), entry.get('id'), entry.get('accession'), self.description)
 
+    def _parse_curation_details(self, el: ElementTree):
+
+        # Keep the element, it is trasformed in a object on first access
+        self._curation_details_el = el
+
+    def _parse_hmm_details(self, el: ElementTree):
+
+        # Keep the element, it is trasformed in a object on first access
+        self._hmm_details_el = el
+
+    def _parse_clan_membership(self, el: ElementTree):
+        self.clan_entry : PfamEntry = PfamEntry('Clan', el.get('clan_id'), el.get('clan_acc'), None)
+
+    def _parse_go_terms(self, el: ElementTree):
+
+        # Parse GO terms in a list of objects
+        self.go_terms: [PfarmGOTerm] = []
+
+        # Iterate over categories
+        for cat in el:
+
+            # The category name
+            category = xml_process_label(cat.get('name'))
+
+            # Insert in the list all the terms
+            for term in cat:
+                self.go_terms.append(PfarmGOTerm(term.get('go_id'), category, xml_process_value(term.text)))
+
+    # Parsers of the child nodes that are not plain text
+    _parsers = { 'curation_details': _parse_curation_details,
+                 'hmm_details':      _parse_hmm_details,
+                 'clan_membership':  _parse_clan_membership,
+                 'go_terms':         _parse_go_terms }
+
+    @cached_property
+    def curation_details(self) -> PfamCurationDetails:
+
+        # Trasform the element curation_details in a object
+        if self._curation_details_el is not None:
+            return PfamCurationDetails(self._curation_details_el)
+
+    @cached_property
+    def hmm_details(self) -> PfamHmmDetails:
+
+        # Trasform the element hmm_details in a object
+        if self._hmm_details_el is not None:
+            return PfamHmmDetails(self._hmm_details_el)
+
     def proteins(self) -> [PfamEntry]:
         return proteins(self.entry.accession)
 
@@ -275,10 +426,12 @@ class PfamFamily:
 
 class PfamMatch:
 
+    __slots__ = ('entry', 'locations')
+
     def __init__(self, element: ElementTree):
 
         # Attribute data of the tag <matches>
-        self.entry: PfamEntry = PfamEntry(element.get('type'), element.get('id'), element.get('accession'), None)
+        self.entry: PfamEntry = PfamEntry(xml_process_label(element.get('type')), element.get('id'), element.get('accession'), None)
 
         # List of locations of matches
         self.locations: [PfamLocation] = []
@@ -296,19 +449,33 @@ class PfamMatch:
 
 class PfamLocation:
 
+    __slots__ = ('start', 'end', 'ali_start', 'ali_end', 'hmm_start', 'hmm_end', 'bitscore', 'evalue',
+                 'evidence', 'significant', 'hmm', 'match_string', 'pp', 'seq', 'raw')
+
+    # Numeric attributes of the <location> tag, read together in a single call
+    _positions = operator.itemgetter('start', 'end', 'ali_start', 'ali_end', 'hmm_start', 'hmm_end')
+    _scores    = operator.itemgetter('bitscore', 'evalue')
+
+    # Types of the numeric attributes, used when some of them are missing or empty
+    _numeric = (('start', int), ('end', int), ('ali_start', int), ('ali_end', int), ('hmm_start', int), ('hmm_end', int),
+                ('bitscore', float), ('evalue', float))
+
     def __init__(self, element: ElementTree):
 
-        # Set members using attributes of <location> tag
-        self.start       : int = element.get('start')
-        self.end         : int = element.get('end')
-        self.ali_start   : int = element.get('ali_start')
-        self.ali_end     : int = element.get('ali_end')
-        self.hmm_start   : int = element.get('hmm_start')
-        self.hmm_end     : int = element.get('hmm_end')
-        self.bitscore    : float = element.get('bitscore')
-        self.evalue      : float = element.get('evalue')
-        self.evidence    : str = element.get('evidence')
-        self.significant : str = element.get('significant')
+        # Set the numeric members converting the attributes of <location> tag in batch
+        try:
+            self.start, self.end, self.ali_start, self.ali_end, self.hmm_start, self.hmm_end = map(int, PfamLocation._positions(element.attrib))
+            self.bitscore, self.evalue = map(float, PfamLocation._scores(element.attrib))
+
+        # Otherwise convert the attributes one by one, the missing or empty ones are None
+        except (KeyError, ValueError):
+            for name, cast in PfamLocation._numeric:
+                value = element.get(name)
+                setattr(self, name, cast(value) if value and value.strip() else None)
+
+        # Set the other members using attributes of <location> tag
+        self.evidence    : str = xml_process_label(element.get('evidence'))
+        self.significant : str = xml_process_value(element.get('significant'))
 
         self.hmm          : str = None
         self.match_string : str = None
@@ -319,70 +486,101 @@ class PfamLocation:
         # Process child nodes
         for el in element:
 
-            # Set an attribute of this object using the text content of the element as value
-            setattr(self, el.tag, el.text)
+            # Set an attribute of this object using the text content of the element as value,
+            # only the known tags have a slot
+            if el.tag in PfamLocation.__slots__:
+                setattr(self, el.tag, xml_process_field(el.tag, el.text))
 
 class PfamProtein:
 
-    def __init__(self, release_version: str, release_date: datetime, entry: ElementTree):
+    def __init__(self, release_version: str, release_date: datetime, entry: ElementTree, matches: list = None):
 
         # The release version of the pfam database
         self.pfam_release_version : str      = release_version
         self.pfam_release_date    : datetime = release_date
 
         # Attributes of this entry
-        self.db_name            : str   = entry.get('db')
-        self.db_release_version : float = entry.get('db_release')
+        self.db_name            : str   = xml_process_label(entry.get('db'))
+        self.db_release_version : str   = xml_process_field('db_release', entry.get('db_release'))
 
         # Text of the family
         self.description : str = None
         self.comment     : str = None
 
-        self.taxonomy_id  : str   = None
-        self.species_name : str   = None
-        self.taxonomy     : [str] = None
-        self.sequence     : str   = None
+        self.taxonomy_id   : int = None
+        self.species_name  : str = None
+        self._taxonomy_raw : str = None
+        self.sequence      : str = None
 
-        # List of matches
-        self.matches: [PfamMatch] = []
+        # List of matches, they can be already built while parsing
+        self.matches: [PfamMatch] = [] if matches is None else matches
 
         # Process child nodes
         for el in entry:
 
-            if el.tag == 'taxonomy':
-                self.taxonomy_id  : int   = el.get('tax_id')
-                self.species_name : str   = el.get('species_name')
-                self.taxonomy     : [str] = el.text.rstrip('.').split('; ')
-
-            elif el.tag == 'sequence':
-                self.sequence_version : int = el.get('version')
-                self.sequence         : str = el.text
-                
-            elif el.tag == 'matches':
-                for match in el:
-                    self.matches.append(PfamMatch(match))
+            # Look up the parser of the element
+            parser = PfamProtein._parsers.get(el.tag)
+
+            if parser is not None:
+                parser(self, el)
             
              # Set an attribute of this object using the text content of the element as value
             else:
-                setattr(self, el.tag, el.text)
+                setattr(self, el.tag, xml_process_field(el.tag, el.text))
 
         # Entry of this protein
         self.entry: PfamEntry = PfamEntry(entry.get('entry_type'), entry.get('id'), entry.get('accession'), self.description)
 
+    def _parse_taxonomy(self, el: ElementTree):
+        self.taxonomy_id   : int = xml_process_field('tax_id', el.get('tax_id'))
+        self.species_name  : str = el.get('species_name')
+
+        # The taxonomy is split in a list only when accessed
+        self._taxonomy_raw : str = xml_process_field('taxonomy', el.text)
+
+    def _parse_sequence(self, el: ElementTree):
+        self.sequence_version : int = xml_process_field('sequence_version', el.get('version'))
+        self.sequence         : str = xml_process_field('sequence', el.text)
+
+    def _parse_matches(self, el: ElementTree):
+
+        # Matches built while parsing the response leave only empty
+        # elements in the tree, they must not be built again
+        if len(self.matches) == 0:
+            for match in el:
+                self.matches.append(PfamMatch(match))
+
+    # Parsers of the child nodes that are not plain text
+    _parsers = { 'taxonomy': _parse_taxonomy,
+                 'sequence': _parse_sequence,
+                 'matches':  _parse_matches }
+
+    @cached_property
+    def taxonomy(self) -> [str]:
+        if self._taxonomy_raw is not None:
+            return self._taxonomy_raw.rstrip('.').split('; ')
+
     def family (self) -> PfamFamily:
 
         # Only if it has a match is possible
         if len(self.matches) > 0:
             return self.matches[0].family()
 
+@lru_cache(maxsize=32)
+def _parse_release_date(release_date: str) -> datetime:
+
+    # The date is the same for all the responses of a release, it is
+    # in the ISO format YYYY-MM-DD parsed in C by fromisoformat
+    return datetime.fromisoformat(release_date)
+
 def family(id) -> PfamFamily:
 
     # Make the request
     root = request('/family/' + id)
 
     # Get the release version of the pfam database
-    release_version = root.get('release')
-    release_date = datetime.strptime(root.get('release_date'), '%Y-%m-%d')
+    release_version = xml_process_value(root.get('release'))
+    release_date = _parse_release_date(root.get('release_date'))
 
     # Return the response parsed
     return PfamFamily(release_version, release_date, root[0])
@@ -393,63 +591,72 @@ def clan(id) -> PfamClan:
     root = request('/clan/' + id)
 
     # Get the release version of the pfam database
-    release_version = root.get('release')
-    release_date = datetime.strptime(root.get('release_date'), '%Y-%m-%d')
+    release_version = xml_process_value(root.get('release'))
+    release_date = _parse_release_date(root.get('release_date'))
 
     # Return the response parsed
     return PfamClan(release_version, release_date, root[0])
 
+def _split_entries(text: str) -> [[str]]:
+
+    # Split each line (entry) in the three fields accession, id and description,
+    # the description can contain tabs and the incomplete lines are skipped
+    return [fields for line in text.splitlines() if len(fields := line.split('\t', 2)) == 3]
+
 def families() -> [PfamEntry]:
 
     # Make the request
     text = request('/families', params={'output': 'text'})
 
-    # Output list
-    output: [PfamEntry] = []
+    # Return the response parsed
+    return [PfamEntry('Pfam-A', fields[1], fields[0], fields[2]) for fields in _split_entries(text)]
 
-    # Iterates over lines (family entry)
-    for line in text.splitlines():
+def clans() -> [PfamEntry]:
 
-        # Split the line in three field
-        fields = line.split('\t')
-        
-        if len(fields) == 3:
-            output.append (PfamEntry('Pfam-A', fields[1], fields[0], fields[2]))
+    # Make the request
+    text = request('/clans', params={'output': 'text'})
 
     # Return the response parsed
-    return output
+    return [PfamEntry('Clan', fields[1], fields[0], fields[2]) for fields in _split_entries(text)]
 
-def clans() -> [PfamEntry]:
+def _read_entries(text: str):
+
+    # Pandas is an optional dependency needed only by the tables
+    import pandas
+
+    # Load the entries as columns, the lines are split as for the lists
+    return pandas.DataFrame(_split_entries(text), columns=['accession', 'id', 'description'], dtype='string')
+
+def families_df():
 
     # Make the request
-    text = request('/clans', params={'output': 'text'})
+    text = request('/families', params={'output': 'text'})
 
-    # Output list
-    output: [PfamEntry] = []
+    # Return the response parsed as a pandas.DataFrame
+    return _read_entries(text)
 
-    # Iterates over lines (family entry)
-    for line in text.splitlines():
+def clans_df():
 
-        # Split the line in three field
-        fields = line.split('\t')
-        
-        if len(fields) == 3:
-            output.append (PfamEntry('Clan', fields[1], fields[0], fields[2]))
+    # Make the request
+    text = request('/clans', params={'output': 'text'})
 
-    # Return the response parsed
-    return output
+    # Return the response parsed as a pandas.DataFrame
+    return _read_entries(text)
 
 def protein(id) -> PfamProtein:
 
+    # Matches are built while the response is parsed
+    matches: [PfamMatch] = []
+
     # Make the request
-    root = request('/protein/' + id)
+    root = request('/protein/' + id, builders={'match': lambda el: matches.append(PfamMatch(el))})
 
     # Get the release version of the pfam database
-    release_version = root.get('release')
-    release_date = datetime.strptime(root.get('release_date'), '%Y-%m-%d')
+    release_version = xml_process_value(root.get('release'))
+    release_date = _parse_release_date(root.get('release_date'))
 
     # Return the response parsed
-    return PfamProtein(release_version, release_date, root[0])
+    return PfamProtein(release_version, release_date, root[0], matches)
 
 
 def proteins(family) -> [PfamEntry]:
@@ -466,15 +673,13 @@ def proteins(family) -> [PfamEntry]:
     # Make the request
     text = request('/family/' + family + '/alignment/full/format', params=params)
 
-    # Output list
-    output: [PfamEntry] = []
-
-    # Iterates over lines
-    for line in text.splitlines():
+    # Return the list of proteins, the name of each line ends at the first '/'
+    return [PfamEntry('sequence', line.partition('/')[0], None, None) for line in text.splitlines()]
 
-        # Split the line to get the name
-        output.append(PfamEntry('sequence', line.split('/')[0], None, None))
 
+def fetch_many(entries: [PfamEntry], max_workers: int = 16) -> list:
 
-    # Return the list of protein names
-    return output
+    # Fetch the entries in parallel on the shared session, the
+    # results are returned in the same order of the entries
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(PfamEntry.fetch, entries))
@@ -8,7 +8,12 @@ setup(name='pfam',
       author_email='alberto.boldrini@studenti.unitn.it',
       license='MIT',
       packages=['pfam'],
+      python_requires='>=3.8',
       install_requires=[
           'requests',
       ],
+      extras_require={
+          'cache': ['requests-cache'],
+          'pandas': ['pandas'],
+      },
       zip_safe=False)
\ No newline at end of file